@@ -1,17 +1,21 @@
+import functools
+import hashlib
+import os
+import unicodedata
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
+import coincurve
 import eth_utils
 from eth_account import Account
-from eth_account.hdaccount import Mnemonic
+from eth_account.hdaccount import Mnemonic, key_from_seed
 from eth_account.types import Language
-from eth_keys import KeyAPI
 from eth_typing import ChecksumAddress
-from eth_utils import decode_hex
+from eth_utils import decode_hex, keccak
 
 Account.enable_unaudited_hdwallet_features()
 
-key_api = KeyAPI()
-
 
 @dataclass
 class NewAccount:
@@ -20,6 +24,14 @@ class NewAccount:
     private_key: str
 
 
+class AddressToPrivate(dict[str, str]):
+    """address (lower case) -> private key"""
+
+    def contains_all_addresses(self, addresses: Iterable[str]) -> bool:
+        return {address.lower() for address in addresses}.issubset(self.keys())
+
+
+@functools.lru_cache(maxsize=4096)
 def to_checksum_address(address: str) -> ChecksumAddress:
     return eth_utils.to_checksum_address(address)
 
@@ -29,44 +41,65 @@ def generate_mnemonic(num_words: int = 24) -> str:
     return mnemonic.generate(num_words=num_words)
 
 
+def _bip39_seed(mnemonic: str, passphrase: str) -> bytes:
+    """Derives the bip39 seed straight through hashlib.pbkdf2_hmac, which routes to OpenSSL.
+
+    The caller must pass an already validated mnemonic.
+    """
+    salt = unicodedata.normalize("NFKD", "mnemonic" + passphrase)
+    return hashlib.pbkdf2_hmac("sha512", unicodedata.normalize("NFKD", mnemonic).encode(), salt.encode(), 2048)
+
+
+def _derive_account(seed: bytes, path: str) -> NewAccount:
+    acc = Account.from_key(key_from_seed(seed, path))
+    private_key = acc.key.hex().lower()
+    if not private_key.startswith("0x"):
+        private_key = f"0x{private_key}"
+    return NewAccount(path, acc.address, private_key)
+
+
 def generate_accounts(  # nosec
     mnemonic: str,
     passphrase: str = "",
     path_prefix: str = "m/44'/60'/0'/0",
     limit: int = 12,
 ) -> list[NewAccount]:
-    result: list[NewAccount] = []
-    for i in range(limit):
-        path = f"{path_prefix}/{i}"
-        acc = Account.from_mnemonic(mnemonic=mnemonic, account_path=path, passphrase=passphrase)
-        private_key = acc.key.hex().lower()
-        if not private_key.startswith("0x"):
-            private_key = f"0x{private_key}"
-        result.append(NewAccount(path, acc.address, private_key))
-    return result
+    if limit <= 0:
+        return []
+    bip39 = Mnemonic(Mnemonic.detect_language(mnemonic))
+    mnemonic = bip39.expand(mnemonic)
+    if not bip39.is_mnemonic_valid(mnemonic):
+        raise eth_utils.ValidationError(f"invalid bip39 mnemonic: {mnemonic}")
+    seed = _bip39_seed(mnemonic, passphrase)  # derive the bip39 seed once, not per index
+    paths = [f"{path_prefix}/{i}" for i in range(limit)]
+    if limit < 32:  # pool startup costs more than serial derivation for small batches
+        return [_derive_account(seed, path) for path in paths]
+    with ProcessPoolExecutor(max_workers=min(limit, os.cpu_count() or 1)) as executor:
+        return list(executor.map(_derive_account, [seed] * limit, paths))
+
+
+def _private_to_public_key(private_key: str) -> bytes:
+    secret = decode_hex(private_key)
+    if len(secret) != 32:  # coincurve left-pads shorter secrets instead of rejecting them
+        raise ValueError("the private key must be exactly 32 bytes long")
+    return coincurve.PublicKey.from_secret(secret).format(compressed=False)[1:]
 
 
 def private_to_address(private_key: str) -> str | None:
     """returns address in lower case"""
     try:
-        return key_api.PrivateKey(decode_hex(private_key)).public_key.to_address().lower()
+        return "0x" + keccak(_private_to_public_key(private_key))[-20:].hex()
     except Exception:
         return None
 
 
-def create_private_keys_dict(private_keys: list[str]) -> dict[str, str]:  # address in lower
-    result = {}
-    for private_key in private_keys:
-        address = private_to_address(private_key)
-        if address is None:
-            raise ValueError("wrong private key")
-        result[address.lower()] = private_key
-    return result
+def create_private_keys_dict(private_keys: list[str]) -> AddressToPrivate:  # address in lower
+    try:
+        public_keys = [_private_to_public_key(pk) for pk in private_keys]
+    except Exception as e:
+        raise ValueError("wrong private key") from e
+    return AddressToPrivate(("0x" + keccak(pub)[-20:].hex(), pk) for pub, pk in zip(public_keys, private_keys, strict=True))
 
 
 def is_private_key(private_key: str) -> bool:
-    try:
-        key_api.PrivateKey(decode_hex(private_key)).public_key.to_address()
-        return True
-    except Exception:
-        return False
+    return private_to_address(private_key) is not None
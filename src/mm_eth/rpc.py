@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from dataclasses import dataclass
 from typing import Any, Literal, cast
 
 import websocket
 from mm_std import Err, Ok, Result, hr, random_choice
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from web3.types import BlockIdentifier
 
 from mm_eth.types import Nodes, Proxies
@@ -57,6 +59,8 @@ class Log:
 
 
 class TxData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     block_number: int | None  # for pending tx it can be none
     from_: str
     to: str | None
@@ -469,6 +473,70 @@ def get_tx_status(rpc_urls: Nodes, tx_hash: str, timeout: int = 5, proxies: Prox
     return res
 
 
+def wait_tx_status(
+    rpc_urls: Nodes,
+    tx_hash: str,
+    timeout: float = 600,
+    proxies: Proxies = None,
+    max_errors: int = 10,
+) -> Result[int]:
+    """Polls get_tx_status with exponential backoff (0.2s up to 4s) until the tx is mined.
+
+    Returns Err("timeout") when the deadline passes and bails out after max_errors consecutive
+    non-pending errors, so a dead node can't spin the loop forever.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.2
+    errors = 0
+    while True:
+        res = get_tx_status(rpc_urls, tx_hash, proxies=proxies, attempts=1)
+        if isinstance(res, Ok):
+            return res
+        if res.err in ("no_receipt", "no_status"):  # still pending
+            errors = 0
+        else:
+            errors += 1
+            if errors >= max_errors:
+                return res
+        if time.monotonic() + delay > deadline:
+            return Err("timeout")
+        time.sleep(delay)
+        delay = min(delay * 1.5, 4.0)
+
+
+class NonceManager:
+    """Caches nonces locally: one eth_getTransactionCount per address, then local increments.
+
+    Thread-safe, so concurrent senders can share one instance and dispatch transfers in parallel.
+    """
+
+    def __init__(self, nodes: Nodes, timeout: int = 10, proxies: Proxies = None, attempts: int = 5) -> None:
+        self._nodes = nodes
+        self._timeout = timeout
+        self._proxies = proxies
+        self._attempts = attempts
+        self._nonces: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def next_nonce(self, address: str) -> Result[int]:
+        """Returns the next nonce for the address and increments the local counter."""
+        address = address.lower()
+        with self._lock:
+            if address not in self._nonces:
+                res = eth_get_transaction_count(self._nodes, address, self._timeout, self._proxies, self._attempts)
+                if isinstance(res, Err):
+                    return res
+                self._nonces[address] = res.ok
+            nonce = self._nonces[address]
+            self._nonces[address] = nonce + 1
+            return Ok(nonce)
+
+    def resync(self, address: str) -> None:
+        """Drops the cached nonce so the next call re-fetches it from the node. Call after a failed send."""
+        with self._lock:
+            self._nonces.pop(address.lower(), None)
+
+
 def get_base_fee_per_gas(rpc_urls: Nodes, timeout: int = 5, proxies: Proxies = None, attempts: int = 5) -> Result[int]:
     res = eth_get_block_by_number(rpc_urls, "latest", False, timeout=timeout, proxies=proxies, attempts=attempts)
     if isinstance(res, Err):
@@ -476,3 +544,89 @@ def get_base_fee_per_gas(rpc_urls: Nodes, timeout: int = 5, proxies: Proxies = N
     if "baseFeePerGas" in res.ok:
         return Ok(int(res.ok["baseFeePerGas"], 16), data=res.data)
     return Err("no_base_fee_per_gas", data=res.data)
+
+
+def _hashable(value: Nodes | Proxies) -> tuple[str, ...] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+_BASE_FEE_TTL = 0.5
+_base_fee_cache: dict[tuple[object, ...], tuple[float, Result[int]]] = {}
+
+
+def get_base_fee_per_gas_cached(rpc_urls: Nodes, timeout: int = 5, proxies: Proxies = None, attempts: int = 5) -> Result[int]:
+    """get_base_fee_per_gas memoized for ~500ms, for callers fetching fees in a tight loop. Errors are not cached."""
+    key = (_hashable(rpc_urls), timeout, _hashable(proxies), attempts)
+    cached = _base_fee_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    res = get_base_fee_per_gas(rpc_urls, timeout, proxies, attempts)
+    if isinstance(res, Ok):
+        _base_fee_cache[key] = (time.monotonic() + _BASE_FEE_TTL, res)
+    return res
+
+
+_CHAIN_ID_CHECK_TTL = 60
+_chain_id_check_cache: dict[tuple[object, ...], tuple[float, Result[bool]]] = {}
+
+
+def check_nodes_for_chain_id(
+    rpc_urls: Nodes,
+    chain_id: int,
+    timeout: int = 10,
+    proxies: Proxies = None,
+    attempts: int = 1,
+) -> Result[bool]:
+    """Checks that every node reports the expected chain id.
+
+    Passing checks are memoized for ~60s per node set; failures always re-query.
+    """
+    nodes = cast(tuple[str, ...], _hashable(rpc_urls))
+    key = (tuple(sorted(nodes)), chain_id, timeout, _hashable(proxies), attempts)
+    cached = _chain_id_check_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    res: Result[bool] = Ok(True)
+    for node in nodes:
+        node_res = eth_chain_id(node, timeout=timeout, proxies=proxies, attempts=attempts)
+        if isinstance(node_res, Err):
+            return node_res
+        if node_res.ok != chain_id:
+            return Err(f"wrong chain_id for {node}: {node_res.ok}", data=node_res.data)
+    _chain_id_check_cache[key] = (time.monotonic() + _CHAIN_ID_CHECK_TTL, res)
+    return res
+
+
+_ESTIMATE_GAS_TTL = 60
+_estimate_gas_cache: dict[tuple[object, ...], tuple[float, Result[int]]] = {}
+
+
+def eth_estimate_gas_cached(
+    rpc_urls: Nodes,
+    from_: str,
+    to: str | None = None,
+    value: int | None = 0,
+    data: str | None = None,
+    type_: Literal["0x0", "0x2"] | None = None,
+    timeout: int = 10,
+    proxies: Proxies = None,
+    attempts: int = 1,
+) -> Result[int]:
+    """eth_estimate_gas memoized for ~60s per call shape, for bulk senders re-estimating identical transfers.
+
+    Errors are not cached, so a transient node failure doesn't poison the whole bucket.
+    """
+    key = (_hashable(rpc_urls), from_, to, value, data, type_, timeout, _hashable(proxies), attempts)
+    cached = _estimate_gas_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    res = eth_estimate_gas(rpc_urls, from_, to, value, data, type_, timeout, proxies, attempts)
+    if isinstance(res, Ok):
+        if len(_estimate_gas_cache) >= 1024:
+            _estimate_gas_cache.clear()
+        _estimate_gas_cache[key] = (time.monotonic() + _ESTIMATE_GAS_TTL, res)
+    return res
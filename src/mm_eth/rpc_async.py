@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+from mm_std import Err, Ok, Result
+
+from mm_eth.types import Nodes, Proxies
+from mm_eth.utils import hex_str_to_int, random_node, random_proxy
+
+_limits = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+_clients: dict[tuple[str, str | None], httpx.AsyncClient] = {}
+
+
+def _get_client(node: str, proxy: str | None) -> httpx.AsyncClient:
+    """One pooled client per (node, proxy), so keep-alive connections survive across calls."""
+    key = (node, proxy)
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(http2=True, limits=_limits, proxy=proxy)
+        _clients[key] = client
+    return client
+
+
+async def close_clients() -> None:
+    while _clients:
+        _, client = _clients.popitem()
+        await client.aclose()
+
+
+async def rpc_call(
+    *,
+    nodes: Nodes,
+    method: str,
+    params: list[object],
+    id_: int = 1,
+    timeout: int = 10,
+    proxies: Proxies = None,
+    attempts: int = 1,
+) -> Result[Any]:
+    data = {"jsonrpc": "2.0", "method": method, "params": params, "id": id_}
+    res: Result[Any] = Err("not started yet")
+    for _ in range(attempts):
+        node = random_node(nodes)
+        if not node.startswith("http"):
+            return Err("ws_nodes_are_not_supported")
+        res = await _http_call(node, data, timeout, random_proxy(proxies))
+        if isinstance(res, Ok):
+            return res
+    return res
+
+
+async def _http_call(node: str, data: dict[str, object], timeout: int, proxy: str | None) -> Result[Any]:
+    try:
+        response = await _get_client(node, proxy).post(node, json=data, timeout=timeout)
+        body = response.json()
+        err = body.get("error", {}).get("message", "")
+        if err:
+            return Err(f"service_error: {err}")
+        if "result" in body:
+            return Ok(body["result"])
+        return Err("unknown_response")
+    except httpx.TimeoutException:
+        return Err("timeout")
+    except Exception as err:
+        return Err(f"exception: {err}")
+
+
+async def eth_block_number(rpc_urls: Nodes, timeout: int = 10, proxies: Proxies = None, attempts: int = 1) -> Result[int]:
+    res = await rpc_call(nodes=rpc_urls, method="eth_blockNumber", params=[], timeout=timeout, proxies=proxies, attempts=attempts)
+    return res.and_then(hex_str_to_int)
+
+
+async def eth_chain_id(rpc_urls: Nodes, timeout: int = 10, proxies: Proxies = None, attempts: int = 1) -> Result[int]:
+    res = await rpc_call(nodes=rpc_urls, method="eth_chainId", params=[], timeout=timeout, proxies=proxies, attempts=attempts)
+    return res.and_then(hex_str_to_int)
+
+
+async def eth_get_balance(
+    rpc_urls: Nodes,
+    address: str,
+    timeout: int = 10,
+    proxies: Proxies = None,
+    attempts: int = 1,
+) -> Result[int]:
+    res = await rpc_call(
+        nodes=rpc_urls,
+        method="eth_getBalance",
+        params=[address, "latest"],
+        timeout=timeout,
+        proxies=proxies,
+        attempts=attempts,
+    )
+    return res.and_then(hex_str_to_int)
+
+
+async def eth_get_transaction_count(
+    rpc_urls: Nodes,
+    address: str,
+    timeout: int = 10,
+    proxies: Proxies = None,
+    attempts: int = 1,
+) -> Result[int]:
+    res = await rpc_call(
+        nodes=rpc_urls,
+        method="eth_getTransactionCount",
+        params=[address, "latest"],
+        timeout=timeout,
+        proxies=proxies,
+        attempts=attempts,
+    )
+    return res.and_then(hex_str_to_int)
+
+
+async def eth_send_raw_transaction(
+    rpc_urls: Nodes,
+    raw_tx: str,
+    timeout: int = 10,
+    proxies: Proxies = None,
+    attempts: int = 1,
+) -> Result[str]:
+    return await rpc_call(
+        nodes=rpc_urls,
+        method="eth_sendRawTransaction",
+        params=[raw_tx],
+        timeout=timeout,
+        proxies=proxies,
+        attempts=attempts,
+    )
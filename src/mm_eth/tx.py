@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-from typing import Any
+import functools
+from dataclasses import dataclass
+from typing import Any, cast
 
 import rlp
+from eth_account import Account
+from eth_keys import KeyAPI
+from eth_keys.backends import CoinCurveECCBackend
 from eth_utils import keccak, to_hex
-from pydantic import BaseModel
 from rlp.sedes import Binary, big_endian_int, binary
 from web3 import Web3
-from web3.auto import w3
 
 from mm_eth.utils import hex_to_bytes
 
+# sign with libsecp256k1 via coincurve even if ECC_BACKEND_CLASS points eth_keys at the pure-python backend
+Account._keys = KeyAPI(CoinCurveECCBackend())
 
-class SignedTx(BaseModel):
+
+@functools.lru_cache(maxsize=4096)
+def _checksum_address(address: bytes) -> str:
+    return Web3.to_checksum_address(address)
+
+
+@dataclass(slots=True, frozen=True)
+class SignedTx:
     tx_hash: str
     raw_tx: str
 
@@ -30,6 +42,21 @@ class RPLTransaction(rlp.Serializable):  # type: ignore[misc]
         ("s", big_endian_int),
     ]
 
+    @staticmethod
+    def new_tx_raw(
+        *,
+        nonce: int,
+        gas_price: int,
+        gas: int,
+        v: int,
+        r: int,
+        s: int,
+        data: bytes | None = None,
+        value: int = 0,
+        to: bytes | None = None,
+    ) -> RPLTransaction:
+        return RPLTransaction(nonce, gas_price, gas, to, value, data, v, r, s)
+
     @staticmethod
     def new_tx(
         *,
@@ -43,18 +70,21 @@ class RPLTransaction(rlp.Serializable):  # type: ignore[misc]
         value: int | None = None,
         to: str | None = None,
     ) -> RPLTransaction:
-        if to:
-            to = hex_to_bytes(to)  # type:ignore
-        if data:
-            data = hex_to_bytes(data)  # type:ignore
-        if not value:
-            value = 0
-        r = int(r, 16)  # type:ignore
-        s = int(s, 16)  # type:ignore
-        return RPLTransaction(nonce, gas_price, gas, to, value, data, v, r, s)
+        return RPLTransaction.new_tx_raw(
+            nonce=nonce,
+            gas_price=gas_price,
+            gas=gas,
+            v=v,
+            r=int(r, 16),
+            s=int(s, 16),
+            data=hex_to_bytes(data) if data else None,
+            value=value or 0,
+            to=hex_to_bytes(to) if to else None,
+        )
 
 
-class DecodedRawTx(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DecodedRawTx:
     tx_hash: str
     from_: str
     to: str | None
@@ -69,6 +99,59 @@ class DecodedRawTx(BaseModel):
     v: int
 
 
+def _rlp_append_bytes(out: bytearray, value: bytes) -> None:
+    n = len(value)
+    if n == 1 and value[0] < 0x80:
+        out += value
+    elif n < 56:
+        out.append(0x80 + n)
+        out += value
+    else:
+        n_bytes = n.to_bytes((n.bit_length() + 7) // 8, "big")
+        out.append(0xB7 + len(n_bytes))
+        out += n_bytes
+        out += value
+
+
+def _rlp_append_int(out: bytearray, value: int) -> None:
+    _rlp_append_bytes(out, value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+def _encode_legacy_tx_rlp(
+    nonce: int,
+    gas_price: int,
+    gas: int,
+    to: bytes,
+    value: int,
+    data: bytes,
+    v: int,
+    r: int,
+    s: int,
+) -> bytes:
+    """Inlined RLP encoding of a signed legacy tx, skipping rlp.Serializable's per-field reflection."""
+    body = bytearray()
+    _rlp_append_int(body, nonce)
+    _rlp_append_int(body, gas_price)
+    _rlp_append_int(body, gas)
+    _rlp_append_bytes(body, to)
+    _rlp_append_int(body, value)
+    _rlp_append_bytes(body, data)
+    _rlp_append_int(body, v)
+    _rlp_append_int(body, r)
+    _rlp_append_int(body, s)
+
+    n = len(body)
+    out = bytearray()
+    if n < 56:
+        out.append(0xC0 + n)
+    else:
+        n_bytes = n.to_bytes((n.bit_length() + 7) // 8, "big")
+        out.append(0xF7 + len(n_bytes))
+        out += n_bytes
+    out += body
+    return bytes(out)
+
+
 def encode_raw_tx_with_signature(
     *,
     nonce: int,
@@ -81,8 +164,18 @@ def encode_raw_tx_with_signature(
     value: int | None = None,
     to: str | None = None,
 ) -> str:
-    tx = RPLTransaction.new_tx(nonce=nonce, gas_price=gas_price, gas=gas, v=v, r=r, s=s, data=data, value=value, to=to)
-    return Web3.to_hex(rlp.encode(tx))
+    raw = _encode_legacy_tx_rlp(
+        nonce,
+        gas_price,
+        gas,
+        hex_to_bytes(to) if to else b"",
+        value or 0,
+        hex_to_bytes(data) if data else b"",
+        v,
+        int(r, 16),
+        int(s, 16),
+    )
+    return Web3.to_hex(raw)
 
 
 def sign_legacy_tx(
@@ -98,13 +191,13 @@ def sign_legacy_tx(
 ) -> SignedTx:
     tx: dict[str, Any] = {"gas": gas, "gasPrice": gas_price, "nonce": nonce, "chainId": chain_id}
     if to:
-        tx["to"] = Web3.to_checksum_address(to)
+        tx["to"] = hex_to_bytes(to)  # bytes address skips checksum re-hashing inside eth_account
     if value:
         tx["value"] = value
     if data:
         tx["data"] = data
 
-    signed = w3.eth.account.sign_transaction(tx, private_key)
+    signed = Account.sign_transaction(tx, private_key)
     return SignedTx(tx_hash=to_hex(signed.hash), raw_tx=to_hex(signed.raw_transaction))
 
 
@@ -133,20 +226,26 @@ def sign_tx(
     if data:
         tx["data"] = data
     if to:
-        tx["to"] = Web3.to_checksum_address(to)
+        tx["to"] = hex_to_bytes(to)  # bytes address skips checksum re-hashing inside eth_account
 
-    signed = w3.eth.account.sign_transaction(tx, private_key)
+    signed = Account.sign_transaction(tx, private_key)
     return SignedTx(tx_hash=signed.hash.hex(), raw_tx=signed.raw_transaction.hex())
 
 
+@functools.lru_cache(maxsize=256)
+def _recover_transaction(raw_tx: str) -> str:
+    return cast(str, Account.recover_transaction(raw_tx))
+
+
 def decode_raw_tx(raw_tx: str) -> DecodedRawTx:
-    tx: Any = rlp.decode(hex_to_bytes(raw_tx), RPLTransaction)
-    tx_hash = Web3.to_hex(keccak(hex_to_bytes(raw_tx)))
-    from_ = w3.eth.account.recover_transaction(raw_tx)
-    to = Web3.to_checksum_address(tx.to) if tx.to else None
+    raw = hex_to_bytes(raw_tx)
+    tx: Any = rlp.decode(raw, RPLTransaction)
+    tx_hash = Web3.to_hex(keccak(raw))
+    from_ = _recover_transaction(raw_tx)
+    to = _checksum_address(tx.to) if tx.to else None
     data = Web3.to_hex(tx.data)
-    r = hex(tx.r)
-    s = hex(tx.s)
+    r = "0x" + tx.r.to_bytes(32, "big").hex()  # r/s are always 32 bytes, format without a bignum hex() round-trip
+    s = "0x" + tx.s.to_bytes(32, "big").hex()
     chain_id = (tx.v - 35) // 2 if tx.v % 2 else (tx.v - 36) // 2
     return DecodedRawTx(
         tx_hash=tx_hash,
@@ -1,3 +1,5 @@
+import dataclasses
+import functools
 import re
 from decimal import Decimal, localcontext
 from typing import Any, cast
@@ -141,6 +143,7 @@ def to_wei_token(value: str | int | Decimal, symbol: str, decimals: int) -> int:
         raise ValueError(f"value has a wrong type: {type(value)}")
 
 
+@functools.lru_cache(maxsize=4096)
 def to_checksum_address(address: str) -> str:
     return Web3.to_checksum_address(address)
 
@@ -160,17 +163,20 @@ def get_chain_name(chain_id: int | str) -> str:
     return chain_id
 
 
-def to_human_readable_tx(tx: dict[str, Any] | BaseModel) -> dict[str, object]:
+def to_human_readable_tx(tx: dict[str, Any] | BaseModel | Any) -> dict[str, object]:
     if isinstance(tx, BaseModel):
         tx = tx.model_dump()
-    tx["human_readable"] = {}
-    tx["human_readable"]["gas_price"] = str(tx["gas_price"] / 10**9) + " gwei"
-    tx["human_readable"]["value"] = str(tx["value"] / 10**18) + " ether"
-    tx["human_readable"]["gas"] = number_with_separator(tx["gas"])
-    if tx.get("chain_id") is not None:
-        tx["human_readable"]["chain_id"] = get_chain_name(tx["chain_id"])
-
-    return tx
+    elif dataclasses.is_dataclass(tx) and not isinstance(tx, type):
+        tx = dataclasses.asdict(tx)
+    result = cast(dict[str, Any], tx)
+    result["human_readable"] = {}
+    result["human_readable"]["gas_price"] = str(result["gas_price"] / 10**9) + " gwei"
+    result["human_readable"]["value"] = str(result["value"] / 10**18) + " ether"
+    result["human_readable"]["gas"] = number_with_separator(result["gas"])
+    if result.get("chain_id") is not None:
+        result["human_readable"]["chain_id"] = get_chain_name(result["chain_id"])
+
+    return result
 
 
 def truncate_hex_str(hex_str: str, digits: int = 4, replace_str: str = "...") -> str:
@@ -1,3 +1,5 @@
+import pytest
+
 from mm_eth import account
 
 
@@ -9,6 +11,7 @@ def test_generate_mnemonic():
 
 def test_generate_accounts():
     assert len(account.generate_accounts(account.generate_mnemonic(), limit=17)) == 17
+    assert account.generate_accounts(account.generate_mnemonic(), limit=0) == []
 
 
 def test_to_checksum_address():
@@ -27,5 +30,19 @@ def test_is_private_key():
     assert account.is_private_key("d17e3e15fd28dea2825073d08ab8b7320555759e5639d889d7b4b314c49743a0")
     assert not account.is_private_key("17e3e15fd28dea2825073d08ab8b7320555759e5639d889d7b4b314c49743a0")
     assert not account.is_private_key("d17e3e15fd28dea2825073d08ab8b7320555759e5639d889d7b4b314c49743a09999999")
+    assert not account.is_private_key("0x" + "11" * 31)  # 31 bytes, must not be padded to a valid key
     assert not account.is_private_key("qwe")
     assert not account.is_private_key("")
+
+
+def test_create_private_keys_dict():
+    private_key = "0xbc2a0bb29ed04fd94cb413a4483e56187e6faf13c2f6f4ab4ec0fa5bef8fd128"
+    result = account.create_private_keys_dict([private_key])
+    assert result == {"0x46246a9e6b931ee2c60a525455c01689ba8eb2ae": private_key}
+    assert result.contains_all_addresses(["0x46246a9e6B931EE2C60a525455c01689bA8eb2Ae"])  # case-insensitive
+    assert not result.contains_all_addresses(["0x46246a9e6b931ee2c60a525455c01689ba8eb2ae", "0x" + "0" * 40])
+
+    with pytest.raises(ValueError):
+        account.create_private_keys_dict(["qwe"])
+    with pytest.raises(ValueError):
+        account.create_private_keys_dict(["0x" + "11" * 31])  # 31 bytes, must not be padded to a valid key
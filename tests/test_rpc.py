@@ -1,10 +1,10 @@
 import pytest
+from mm_std import Err, Ok
 
 from mm_eth import rpc, tx
 
-pytestmark = pytest.mark.infura
-
 
+@pytest.mark.infura
 def test_eth_block_number(infura):
     res = rpc.eth_block_number(infura())
     assert res.unwrap() > 9_000_000
@@ -13,47 +13,56 @@ def test_eth_block_number(infura):
     assert res.unwrap() > 9_000_000
 
 
+@pytest.mark.infura
 def test_eth_get_code(infura, address_bnb):
     res = rpc.eth_get_code(infura(), address_bnb)
     assert res.unwrap().startswith("0x606060405236")
 
 
+@pytest.mark.infura
 def test_net_version(infura):
     res = rpc.net_version(infura())
     assert res.unwrap() == "1"
 
 
+@pytest.mark.infura
 def test_eth_send_raw_transaction(infura, private_0, address_1):
     raw_tx = tx.sign_legacy_tx(nonce=0, gas_price=111, gas=21000, private_key=private_0, chain_id=1, value=222, to=address_1)
     res = rpc.eth_send_raw_transaction(infura(), raw_tx.raw_tx)
     assert res.unwrap_err().startswith("service_error: insufficient funds for")
 
 
+@pytest.mark.infura
 def test_web3_client_version(infura):
     res = rpc.web3_client_version(infura())
     assert res.unwrap().startswith("Geth")
 
 
+@pytest.mark.infura
 def test_net_peer_count(infura):
     res = rpc.net_peer_count(infura())
     assert res.unwrap() > 1
 
 
+@pytest.mark.infura
 def test_eth_get_balance(infura, address_bnb):
     res = rpc.eth_get_balance(infura(), address_bnb)
     assert res.unwrap() > 1
 
 
+@pytest.mark.infura
 def test_eth_get_block_by_number(infura):
     res = rpc.eth_get_block_by_number(infura(), 8972973, True)
     assert res.unwrap()["transactions"][0]["hash"] == "0x1bc1f41a0999c4ff4afe8f17704400ba0328b8b8bf60681fb809969c2127054a"
 
 
+@pytest.mark.infura
 def test_eth_get_logs(infura, address_bnb):
     res = rpc.eth_get_logs(infura(), address=address_bnb, from_block=9_000_000, to_block=9_001_000)
     assert len(res.unwrap()) == 70
 
 
+@pytest.mark.infura
 def test_eth_get_transaction_receipt(mainnet_archive_node):
     res = rpc.eth_get_transaction_receipt(
         mainnet_archive_node,
@@ -62,6 +71,7 @@ def test_eth_get_transaction_receipt(mainnet_archive_node):
     assert res.unwrap().block_number == 3154196
 
 
+@pytest.mark.infura
 def test_eth_get_transaction_by_hash(mainnet_archive_node):
     res = rpc.eth_get_transaction_by_hash(
         mainnet_archive_node,
@@ -70,6 +80,7 @@ def test_eth_get_transaction_by_hash(mainnet_archive_node):
     assert res.unwrap().block_number == 9914284
 
 
+@pytest.mark.infura
 def test_eth_call(infura, address_tether):
     # get tether balance of bnb address
     data = "0x27e235e3000000000000000000000000B8c77482e45F1F44dE1745F52C74426C631bDD52"
@@ -77,27 +88,84 @@ def test_eth_call(infura, address_tether):
     assert int(res.unwrap(), 16) > 1_000_000
 
 
+@pytest.mark.infura
 def test_eth_estimate_gas(infura, address_0, address_1):
     data = "0x27e235e30000000000000000000000003f5ce5fbfe3e9af3971dd833d26ba9b5c936f0be"
     res = rpc.eth_estimate_gas(infura(), from_=address_0, to=address_1, data=data)
     assert res.unwrap() == 21598
 
 
+@pytest.mark.infura
 def test_eth_gas_price(anvil):
     res = rpc.eth_gas_price(anvil.rpc_url)
     assert res.unwrap() > 1_000_000
 
 
+@pytest.mark.infura
 def test_eth_syncing(anvil):
     res = rpc.eth_syncing(anvil.rpc_url)
     assert res.unwrap() is False
 
 
+@pytest.mark.infura
 def test_eth_chain_id(anvil):
     res = rpc.eth_chain_id(anvil.rpc_url)
     assert res.ok == anvil.chain_id
 
 
+@pytest.mark.infura
 def test_get_base_fee_per_gas(anvil):
     res = rpc.get_base_fee_per_gas(anvil.rpc_url)
     assert res.unwrap() == 1000000000
+
+
+def test_nonce_manager(monkeypatch):
+    calls = []
+
+    def fake_count(nodes, address, timeout, proxies, attempts):
+        calls.append(address)
+        return Ok(7)
+
+    monkeypatch.setattr(rpc, "eth_get_transaction_count", fake_count)
+    manager = rpc.NonceManager("http://node")
+    assert manager.next_nonce("0xAbC").unwrap() == 7
+    assert manager.next_nonce("0xabc").unwrap() == 8  # incremented locally, no extra fetch
+    assert calls == ["0xabc"]
+
+    manager.resync("0xABC")
+    assert manager.next_nonce("0xabc").unwrap() == 7
+    assert calls == ["0xabc", "0xabc"]
+
+
+def test_nonce_manager_fetch_error(monkeypatch):
+    results = [Err("timeout"), Ok(3)]
+    monkeypatch.setattr(rpc, "eth_get_transaction_count", lambda *_args: results.pop(0))
+    manager = rpc.NonceManager("http://node")
+    assert manager.next_nonce("0xabc").unwrap_err() == "timeout"
+    assert manager.next_nonce("0xabc").unwrap() == 3  # error was not cached
+
+
+def test_wait_tx_status(monkeypatch):
+    results = [Err("no_receipt"), Err("no_receipt"), Ok(1)]
+    monkeypatch.setattr(rpc, "get_tx_status", lambda *_args, **_kwargs: results.pop(0))
+    monkeypatch.setattr(rpc.time, "sleep", lambda _seconds: None)
+    assert rpc.wait_tx_status("http://node", "0x1").unwrap() == 1
+    assert results == []
+
+
+def test_wait_tx_status_timeout(monkeypatch):
+    monkeypatch.setattr(rpc, "get_tx_status", lambda *_args, **_kwargs: Err("no_receipt"))
+    assert rpc.wait_tx_status("http://node", "0x1", timeout=0).unwrap_err() == "timeout"
+
+
+def test_wait_tx_status_max_errors(monkeypatch):
+    calls = []
+
+    def fake_status(*_args, **_kwargs):
+        calls.append(1)
+        return Err("connection_error")
+
+    monkeypatch.setattr(rpc, "get_tx_status", fake_status)
+    monkeypatch.setattr(rpc.time, "sleep", lambda _seconds: None)
+    assert rpc.wait_tx_status("http://node", "0x1", max_errors=3).unwrap_err() == "connection_error"
+    assert len(calls) == 3
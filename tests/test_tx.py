@@ -1,3 +1,7 @@
+import random
+
+import rlp
+
 from mm_eth import tx
 
 
@@ -39,3 +43,38 @@ def test_encode_raw_tx_with_signature():
         to=decoded_tx.to,
     )
     assert res == raw_tx
+
+
+def test_encode_legacy_tx_rlp():
+    # (nonce, gas_price, gas, to, value, data, v, r, s)
+    cases = [
+        (0, 0, 0, b"", 0, b"", 0, 0, 0),  # all-zero ints and empty to/data
+        (1, 1, 1, bytes(20), 1, b"\x00", 27, 1, 1),
+        (31, 11, 22, bytes.fromhex("58487485c3858109f5a37e42546fe87473f79a4b"), 33, b"\x12\x39\x99", 38, 2**256 - 1, 2**255),
+        (2**32, 2**64, 21000, bytes(20), 2**96, b"\x01" * 200, 38, 2**255, 2**255),  # >55-byte data and payload
+    ]
+    rng = random.Random(0)
+    for _ in range(200):
+        cases.append(
+            (
+                rng.randrange(2**32),
+                rng.randrange(2**64),
+                rng.randrange(2**32),
+                rng.choice([b"", rng.randbytes(20)]),
+                rng.randrange(2**96),
+                rng.randbytes(rng.randrange(0, 100)),
+                rng.randrange(2**16),
+                rng.randrange(2**256),
+                rng.randrange(2**256),
+            ),
+        )
+    for fields in cases:
+        assert tx._encode_legacy_tx_rlp(*fields) == rlp.encode(tx.RPLTransaction(*fields))
+
+
+def test_decode_raw_tx_r_s_format():
+    raw_tx = "0xf8601f0b169458487485c3858109f5a37e42546fe87473f79a4b218312399926a00739cb05ce6b1370b4dd53745e51202c2416427d47f60dd19cedbbec1ae8d5d0a064eea36637d9bd09b6e2efa8d20a906fd0146a6798a1b4db29457b6e9539862b"  # noqa
+    res = tx.decode_raw_tx(raw_tx)
+    # r/s keep their leading zeros: always 0x + 64 hex chars
+    assert res.r == "0x0739cb05ce6b1370b4dd53745e51202c2416427d47f60dd19cedbbec1ae8d5d0"
+    assert res.s == "0x64eea36637d9bd09b6e2efa8d20a906fd0146a6798a1b4db29457b6e9539862b"